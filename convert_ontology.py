@@ -2,15 +2,33 @@
 
 import argparse
 import enum
-import json
 from pathlib import Path
 import re
 from typing import Any, Mapping
 
+import orjson
 import pandas as pd
 
 JsonObject = Mapping[str, Any]
 
+ARG_LABEL_RE = re.compile(r"arg(\d+) label")
+ARG_COLUMN_RE = re.compile(r"arg\d+ (label|type constraints)")
+FIXED_COLUMNS = frozenset(
+    ["AnnotIndexID", "Type", "Subtype", "Sub-subtype", "Definition", "Template"]
+)
+
+
+def is_used_column(col: str) -> bool:
+    """Checks whether the converter reads a spreadsheet column.
+
+    Args:
+        col: Column name.
+
+    Returns:
+        Whether the column is needed for conversion.
+    """
+    return col in FIXED_COLUMNS or ARG_COLUMN_RE.fullmatch(col) is not None
+
 
 @enum.unique
 class Sheets(enum.Enum):
@@ -30,34 +48,54 @@ def convert_sheet(sheet: pd.DataFrame, sheet_type: Sheets) -> JsonObject:
     Returns:
         Usable representation of events, entities, or relations.
     """
-    arg_label_matches = (re.match(r"arg(\d+) label", col) for col in sheet.columns)
+    columns = sheet.columns.tolist()
+    arg_label_matches = (ARG_LABEL_RE.match(col) for col in columns)
     arg_label_ints = (int(match.group(1)) for match in arg_label_matches if match is not None)
     max_arg_label_col = max(arg_label_ints, default=0) + 1
 
+    # Resolve column positions once so the row loop can use plain tuple indexing
+    col_idx = {col: i for i, col in enumerate(columns)}
+
+    # Pull the arg columns out as plain lists and preprocess the constraints once,
+    # so the row loop only indexes into them
+    arg_data = [
+        (
+            f"arg{i}",
+            sheet[f"arg{i} label"].tolist(),
+            [
+                constraints.upper().split(", ") if isinstance(constraints, str) else None
+                for constraints in sheet[f"arg{i} type constraints"].tolist()
+            ],
+        )
+        for i in range(1, max_arg_label_col)
+    ]
+
+    # Build the full type strings in one vectorized pass instead of joining per row
+    if sheet_type == Sheets.ENTITIES:
+        types = sheet["Type"].to_numpy()
+    else:
+        types = (sheet["Type"] + "." + sheet["Subtype"] + "." + sheet["Sub-subtype"]).to_numpy()
+
     items = {}
-    for row in sheet.iterrows():
-        row = row[1]
-        if sheet_type == Sheets.ENTITIES:
-            item_type = row["Type"]
-        else:
-            item_type = ".".join([row["Type"], row["Subtype"], row["Sub-subtype"]])
+    for row_num, row in enumerate(sheet.itertuples(index=False, name=None)):
+        item_type = types[row_num]
         item = {
-            "id": row["AnnotIndexID"],
+            "id": row[col_idx["AnnotIndexID"]],
             "type": item_type,
-            "definition": row["Definition"],
+            "definition": row[col_idx["Definition"]],
         }
         if sheet_type != Sheets.ENTITIES:
             item.update(
                 {
-                    "template": row["Template"],
+                    "template": row[col_idx["Template"]],
                     "args": {
-                        row[f"arg{i} label"]: {
-                            "position": f"arg{i}",
-                            "label": row[f"arg{i} label"],
-                            "constraints": row[f"arg{i} type constraints"].upper().split(", "),
+                        labels[row_num]: {
+                            "position": position,
+                            "label": labels[row_num],
+                            "constraints": constraints[row_num],
                         }
-                        for i in range(1, max_arg_label_col)
-                        if isinstance(row[f"arg{i} label"], str)
+                        for position, labels, constraints in arg_data
+                        if isinstance(labels[row_num], str)
                     },
                 }
             )
@@ -75,12 +113,16 @@ def main() -> None:
     args = p.parse_args()
 
     source_file_name = args.in_file.name
-    events_sheet = pd.read_excel(args.in_file, sheet_name=Sheets.EVENTS.value)
-    events = convert_sheet(events_sheet, Sheets.EVENTS)
-    entities_sheet = pd.read_excel(args.in_file, sheet_name=Sheets.ENTITIES.value)
-    entities = convert_sheet(entities_sheet, Sheets.ENTITIES)
-    relations_sheet = pd.read_excel(args.in_file, sheet_name=Sheets.RELATIONS.value)
-    relations = convert_sheet(relations_sheet, Sheets.RELATIONS)
+    # Parse the workbook once; pandas opens it in openpyxl's read-only mode,
+    # which streams rows instead of building the full style/relation graph
+    excel_file = pd.ExcelFile(args.in_file, engine="openpyxl")
+    # Restricting to the used columns skips dtype inference and array allocation
+    # for the unused trailing columns of each sheet
+    sheets = excel_file.parse(sheet_name=[sheet.value for sheet in Sheets],
+                              usecols=is_used_column, dtype="string")
+    events = convert_sheet(sheets[Sheets.EVENTS.value], Sheets.EVENTS)
+    entities = convert_sheet(sheets[Sheets.ENTITIES.value], Sheets.ENTITIES)
+    relations = convert_sheet(sheets[Sheets.RELATIONS.value], Sheets.RELATIONS)
     output = {
         "source_file": source_file_name,
         "events": events,
@@ -88,8 +130,7 @@ def main() -> None:
         "relations": relations,
     }
 
-    with open(args.out_file, "w") as file:
-        json.dump(output, file, ensure_ascii=False, indent=2)
+    args.out_file.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
 
 
 if __name__ == "__main__":
@@ -1,21 +1,30 @@
 import argparse
-import json
 
+import orjson
 import yaml
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
 
-def search_and_tag(sc_obj, target_slot, val):
-    if "slots" in sc_obj:
-        for slt in sc_obj["slots"]:
-            if slt["id"] == target_slot:
-                slt["refVar"] = val
-                return
 
+def build_slot_index(sc_obj):
+    slot_by_id = {}
     for stp in sc_obj["steps"]:
         for slt in stp["slots"]:
-            if slt["id"] == target_slot:
-                slt["refVar"] = val
-                return
+            slot_by_id[slt["id"]] = slt
+    # Schema-level slots take precedence over step slots with the same id
+    if "slots" in sc_obj:
+        for slt in sc_obj["slots"]:
+            slot_by_id[slt["id"]] = slt
+    return slot_by_id
+
+
+def search_and_tag(slot_by_id, target_slot, val):
+    slt = slot_by_id.get(target_slot)
+    if slt is not None:
+        slt["refVar"] = val
 
 
 def parse_arguments():
@@ -34,8 +43,8 @@ def parse_arguments():
 if __name__ == "__main__":
     args = parse_arguments()
 
-    with open(args.sdf_path) as sdf_f:
-        data = json.load(sdf_f)
+    with open(args.sdf_path, "rb") as sdf_f:
+        data = orjson.loads(sdf_f.read())
 
     yaml_obj = {}
 
@@ -124,6 +133,7 @@ if __name__ == "__main__":
                     sc_obj["order"].append(od_obj)
 
             # Accounting for sameAs relations only
+            slot_by_id = build_slot_index(sc_obj)
             refVar_counter = 0
             for rels in sch["entityRelations"]:
                 has_corefs = False
@@ -136,12 +146,13 @@ if __name__ == "__main__":
                 if not has_corefs:
                     continue
 
-                search_and_tag(sc_obj, rels["relationSubject"], str(refVar_counter))
+                search_and_tag(slot_by_id, rels["relationSubject"], str(refVar_counter))
                 for r in rels["relations"]:
                     confVal = f" (conf.: {r['confidence']})" if "confidence" in r else ""
                     if r["relationPredicate"] == "kairos:Relations/sameAs" or r[
                         "relationPredicate"] == "kairos:primitives/Relations/SameAs":
-                        search_and_tag(sc_obj, r["relationObject"], str(refVar_counter) + confVal)
+                        search_and_tag(slot_by_id, r["relationObject"],
+                                       str(refVar_counter) + confVal)
 
                 refVar_counter += 1
 
@@ -190,4 +201,4 @@ if __name__ == "__main__":
 
             yaml_obj["primitives"].append(pm_obj)
 
-    print(yaml.dump(yaml_obj, default_flow_style=False, sort_keys=False))
+    print(yaml.dump(yaml_obj, Dumper=YamlDumper, default_flow_style=False, sort_keys=False))
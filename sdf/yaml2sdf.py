@@ -1,38 +1,138 @@
 """Converts CMU YAML into KAIROS SDF JSON-LD."""
 
 import argparse
-from collections import Counter, defaultdict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import itertools
-import json
 import logging
 from pathlib import Path
-import random
+import re
+import sys
 import typing
-from typing import Any, List, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
-
-from pydantic import parse_obj_as
+from typing import (
+    Any,
+    FrozenSet,
+    List,
+    Mapping,
+    MutableMapping,
+    NamedTuple,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import orjson
+from pydantic import TypeAdapter
 import requests
-from typing_extensions import TypedDict
 import yaml
 
 from yaml_schema import Before, Container, Overlaps, Schema, Slot, Step
 
-ONTOLOGY: Optional[Mapping[str, Any]] = None
+# Built once so the validator is only compiled on import
+SCHEMA_LIST_ADAPTER = TypeAdapter(List[Schema])
+
+try:
+    # LibYAML is much faster than the pure-Python loader when available
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+logger = logging.getLogger(__name__)
+
+
+class StepMapItem(NamedTuple):
+    """Step lookup entry used when building order relations.
+
+    Attributes:
+        id: Full step ID.
+        step_idx: 1-based index of the step.
+    """
+
+    id: str
+    step_idx: int
+
+
+class OntologyIndex(NamedTuple):
+    """Membership sets for ontology validation.
+
+    Attributes:
+        event_types: Valid event types.
+        entity_types: Valid entity types.
+        event_args: Valid argument labels per event type.
+    """
+
+    event_types: FrozenSet[str]
+    entity_types: FrozenSet[str]
+    event_args: Mapping[str, FrozenSet[str]]
+
 
+# Placeholder entities for slots without a refvar; a counter keeps output deterministic
+MISSING_REFVAR_COUNTER = itertools.count()
 
+# First CamelCase token of a role: a non-space character followed by
+# everything up to the next uppercase letter or whitespace
+FIRST_TOKEN_RE = re.compile(r"\s*(\S[^A-Z\s]*)")
+
+# Constant URI prefixes, hoisted out of the per-step/per-constraint loops
+EVENT_PREFIX = sys.intern("kairos:Primitives/Events/")
+ENTITY_PREFIX = sys.intern("kairos:Primitives/Entities/")
+
+# Shared envelope constants for SDF output; serialization copies values,
+# so aliasing the same list across libraries is safe
+SDF_CONTEXT = ["https://kairos-sdf.s3.amazonaws.com/context/kairos-v0.9.jsonld"]
+SDF_VERSION = "0.9"
+
+# Keys already warned about, so batch runs do not repeat identical warnings
+WARNED_PRIMITIVES: Set[str] = set()
+WARNED_ROLES: Set[Tuple[str, str]] = set()
+WARNED_ENTITIES: Set[str] = set()
+
+
+@lru_cache(maxsize=None)
 def get_ontology() -> Mapping[str, Any]:
     """Loads the ontology from the JSON file.
 
     Returns:
         Ontology.
     """
-    global ONTOLOGY  # pylint: disable=global-statement
+    ontology: Mapping[str, Any] = orjson.loads(Path("ontology.json").read_bytes())
+    return ontology
 
-    if ONTOLOGY is None:
-        with Path("ontology.json").open() as file:
-            ONTOLOGY = json.load(file)
 
-    return ONTOLOGY
+@lru_cache(maxsize=None)
+def get_ontology_index() -> OntologyIndex:
+    """Builds hashed membership sets from the ontology once.
+
+    Returns:
+        Ontology index.
+    """
+    ontology = get_ontology()
+    return OntologyIndex(
+        frozenset(ontology['events']),
+        frozenset(ontology['entities']),
+        {name: frozenset(event['args']) for name, event in ontology['events'].items()},
+    )
+
+
+@lru_cache(maxsize=None)
+def normalize_primitive(primitive: str) -> str:
+    """Expands a primitive to the full Type.Subtype.Sub-subtype form.
+
+    Cached because primitives repeat across steps and schemas.
+
+    Args:
+        primitive: Event primitive from YAML.
+
+    Returns:
+        Normalized primitive.
+    """
+    # Add missing "Unspecified"s
+    primitive_segments = primitive.split(".")
+    if len(primitive_segments) < 3:
+        primitive_segments.extend(["Unspecified"] * (3 - len(primitive_segments)))
+    return ".".join(primitive_segments)
 
 
 def get_step_type(step: Step) -> str:
@@ -44,16 +144,14 @@ def get_step_type(step: Step) -> str:
     Returns:
         Step type.
     """
-    # Add missing "Unspecified"s
-    primitive_segments = step.primitive.split(".")
-    if len(primitive_segments) < 3:
-        primitive_segments.extend(["Unspecified"] * (3 - len(primitive_segments)))
-    primitive = ".".join(primitive_segments)
+    primitive = normalize_primitive(step.primitive)
 
-    if primitive not in get_ontology()['events']:
-        logging.warning(f"Primitive '{step.primitive}' in step '{step.id}' not in ontology")
+    if primitive not in get_ontology_index().event_types and primitive not in WARNED_PRIMITIVES:
+        WARNED_PRIMITIVES.add(primitive)
+        logger.warning("Primitive '%s' in step '%s' not in ontology", step.primitive, step.id)
 
-    return f"kairos:Primitives/Events/{primitive}"
+    # Step types repeat across steps and schemas; interning dedupes the copies
+    return sys.intern(EVENT_PREFIX + primitive)
 
 
 def get_slot_role(slot: Slot, step_type: str) -> str:
@@ -66,13 +164,32 @@ def get_slot_role(slot: Slot, step_type: str) -> str:
     Returns:
         Slot role.
     """
-    event_type = get_ontology()['events'].get(step_type.split("/")[-1], None)
-    if event_type is not None and slot.role not in event_type['args']:
-        logging.warning(f"Role '{slot.role}' is not valid for event '{event_type['type']}'")
+    event_name = step_type.split("/")[-1]
+    valid_args = get_ontology_index().event_args.get(event_name)
+    if (valid_args is not None and slot.role not in valid_args
+            and (event_name, slot.role) not in WARNED_ROLES):
+        WARNED_ROLES.add((event_name, slot.role))
+        logger.warning("Role '%s' is not valid for event '%s'", slot.role, event_name)
 
     return f"{step_type}/Slots/{slot.role}"
 
 
+@lru_cache(maxsize=None)
+def get_role_name(role: str) -> str:
+    """Gets base slot name for a role.
+
+    Cached because the same roles repeat across steps and schemas.
+
+    Args:
+        role: Semantic role.
+
+    Returns:
+        Base slot name.
+    """
+    match = FIRST_TOKEN_RE.match(role)
+    return match.group(1).lower() if match else role.lower()
+
+
 def get_slot_name(slot: Slot, slot_shared: bool) -> str:
     """Gets slot name.
 
@@ -83,30 +200,27 @@ def get_slot_name(slot: Slot, slot_shared: bool) -> str:
     Returns:
         Slot name.
     """
-    name = "".join([' ' + x if x.isupper() else x for x in slot.role]).lstrip()
-    name = name.split()[0].lower()
+    name = get_role_name(slot.role)
     if slot_shared and slot.refvar is not None:
         name += "-" + slot.refvar
     return name
 
 
-def get_slot_id(slot: Slot, schema_slot_counter: typing.Counter[str],
-                schema_id: str, slot_shared: bool) -> str:
+def get_slot_id(slot_name: str, schema_slot_counter: typing.Counter[str],
+                slots_prefix: str) -> str:
     """Gets slot ID.
 
     Args:
-        slot: Slot data.
+        slot_name: Slot name.
         schema_slot_counter: Slot counter.
-        schema_id: Schema ID.
-        slot_shared: Whether slot is shared.
+        slots_prefix: Prefix for slot IDs.
 
     Returns:
         Slot ID.
     """
-    slot_name = get_slot_name(slot, slot_shared)
     slot_id = chr(schema_slot_counter[slot_name] + 97)
     schema_slot_counter[slot_name] += 1
-    return f"{schema_id}/Slots/{slot_name}-{slot_id}"
+    return slots_prefix + slot_name + "-" + slot_id
 
 
 def get_slot_constraints(constraints: Sequence[str]) -> Sequence[str]:
@@ -118,21 +232,25 @@ def get_slot_constraints(constraints: Sequence[str]) -> Sequence[str]:
     Returns:
         Slot constraints.
     """
+    entity_types = get_ontology_index().entity_types
     for entity in constraints:
-        if entity not in get_ontology()['entities']:
-            logging.warning(f"Entity '{entity}' not in ontology")
+        if entity not in entity_types and entity not in WARNED_ENTITIES:
+            WARNED_ENTITIES.add(entity)
+            logger.warning("Entity '%s' not in ontology", entity)
 
-    return [f"kairos:Primitives/Entities/{entity}" for entity in constraints]
+    # The same entity URIs appear on many slots; interning dedupes the copies
+    return [sys.intern(ENTITY_PREFIX + entity) for entity in constraints]
 
 
-def create_slot(slot: Slot, schema_slot_counter: typing.Counter[str], schema_id: str, step_type: str,
-                slot_shared: bool, entity_map: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
+def create_slot(slot: Slot, schema_slot_counter: typing.Counter[str], slots_prefix: str,
+                step_type: str, slot_shared: bool,
+                entity_map: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
     """Gets slot.
 
     Args:
         slot: Slot data.
         schema_slot_counter: Slot counter.
-        schema_id: Schema ID.
+        slots_prefix: Prefix for slot IDs.
         step_type: Type of step.
         slot_shared: Whether slot is shared.
         entity_map: Mapping from mentions to entities.
@@ -140,43 +258,43 @@ def create_slot(slot: Slot, schema_slot_counter: typing.Counter[str], schema_id:
     Returns:
         Slot.
     """
-    cur_slot: MutableMapping[str, Any] = {
-        "name": get_slot_name(slot, slot_shared),
-        "@id": get_slot_id(slot, schema_slot_counter, schema_id, slot_shared),
-        "role": get_slot_role(slot, step_type),
-    }
-
+    slot_name = get_slot_name(slot, slot_shared)
+    slot_id = get_slot_id(slot_name, schema_slot_counter, slots_prefix)
     constraints = get_slot_constraints(slot.constraints if slot.constraints is not None else [])
-    if constraints:
-        cur_slot["entityTypes"] = constraints
-    if slot.reference is not None:
-        cur_slot["reference"] = slot.reference
 
     # Get entity ID for relations
     if slot.refvar is not None:
-        entity_map[cur_slot["@id"]] = slot.refvar
-        cur_slot["refvar"] = slot.refvar
+        entity_map[slot_id] = slot.refvar
     else:
-        logging.warning(f"{slot} misses refvar")
-        entity_map[cur_slot["@id"]] = str(random.random())
+        logger.warning("%s misses refvar", slot)
+        entity_map[slot_id] = f"__missing_{next(MISSING_REFVAR_COUNTER)}"
 
-    if slot.comment is not None:
-        cur_slot["comment"] = slot.comment
+    # One literal with conditional spreads builds the dict at its final size
+    # instead of growing it field by field
+    cur_slot: MutableMapping[str, Any] = {
+        "name": slot_name,
+        "@id": slot_id,
+        "role": get_slot_role(slot, step_type),
+        **({"entityTypes": constraints} if constraints else {}),
+        **({"reference": slot.reference} if slot.reference is not None else {}),
+        **({"refvar": slot.refvar} if slot.refvar is not None else {}),
+        **({"comment": slot.comment} if slot.comment is not None else {}),
+    }
 
     return cur_slot
 
 
-def get_step_id(step: Step, schema_id: str) -> str:
+def get_step_id(step: Step, steps_prefix: str) -> str:
     """Gets step ID.
 
     Args:
         step: Step data.
-        schema_id: Schema ID.
+        steps_prefix: Prefix for step IDs.
 
     Returns:
         Step ID.
     """
-    return f"{schema_id}/Steps/{step.id}"
+    return steps_prefix + step.id
 
 
 def convert_yaml_to_sdf(yaml_data: Schema) -> Mapping[str, Any]:
@@ -205,10 +323,14 @@ def convert_yaml_to_sdf(yaml_data: Schema) -> Mapping[str, Any]:
     }
 
     # Get comments
-    comments = [x.id.replace("-", " ") for x in yaml_data.steps]
-    comments = ["Steps:"] + [f"{idx + 1}. {text}" for idx, text in enumerate(comments)]
+    comments = ["Steps:"] + [f"{idx + 1}. {step.id.replace('-', ' ')}"
+                             for idx, step in enumerate(yaml_data.steps)]
     schema["comment"] = comments
 
+    # ID prefixes are constant per schema, so build them once
+    slots_prefix = schema["@id"] + "/Slots/"
+    steps_prefix = schema["@id"] + "/Steps/"
+
     # Get steps
     steps = []
 
@@ -216,45 +338,54 @@ def convert_yaml_to_sdf(yaml_data: Schema) -> Mapping[str, Any]:
     entity_map: MutableMapping[str, Any] = {}
 
     # For order
-    class StepMapItem(TypedDict):
-        id: str
-        step_idx: int
-
     step_map: MutableMapping[str, StepMapItem] = {}
 
     # For naming slot ID
     schema_slot_counter: typing.Counter[str] = Counter()
 
+    # Flat view of all step slots for the suffix cleanup below
+    all_step_slots: List[MutableMapping[str, Any]] = []
+
     for idx, step in enumerate(yaml_data.steps):
-        cur_step: MutableMapping[str, Any] = {
-            "@id": get_step_id(step, schema["@id"]),
-            "name": step.id,
-            "@type": get_step_type(step),
-            "comment": comments[idx + 1],
-        }
+        comment = comments[idx + 1]
         if step.comment is not None:
-            cur_step["comment"] += "\n" + step.comment
+            comment += "\n" + step.comment
+        step_id = get_step_id(step, steps_prefix)
+        step_type = get_step_type(step)
 
         # if "provenance" in step:
         #     cur_step["provenance"] = step["provenance"]
 
-        step_map[step.id] = {"id": cur_step["@id"], "step_idx": idx + 1}
+        step_map[step.id] = StepMapItem(step_id, idx + 1)
 
         slots = []
-        for slot in step.slots:
-            slot_shared = sum([slot.role == sl.role for sl in step.slots]) > 1
+        step_slots = step.slots
+        role_counts = Counter(sl.role for sl in step_slots)
+        for slot in step_slots:
+            slot_shared = role_counts[slot.role] > 1
 
             slots.append(
-                create_slot(slot, schema_slot_counter, schema["@id"], cur_step["@type"], slot_shared, entity_map))
+                create_slot(slot, schema_slot_counter, slots_prefix, step_type,
+                            slot_shared, entity_map))
 
-        cur_step["participants"] = slots
+        cur_step: MutableMapping[str, Any] = {
+            "@id": step_id,
+            "name": step.id,
+            "@type": step_type,
+            "comment": comment,
+            "participants": slots,
+        }
+        all_step_slots.extend(slots)
         steps.append(cur_step)
 
     slots = []
-    for slot in yaml_data.slots:
-        slot_shared = sum([slot.role == sl.role for sl in yaml_data.slots]) > 1
+    schema_slots = yaml_data.slots
+    role_counts = Counter(sl.role for sl in schema_slots)
+    for slot in schema_slots:
+        slot_shared = role_counts[slot.role] > 1
 
-        parsed_slot = create_slot(slot, schema_slot_counter, schema["@id"], schema["@id"], slot_shared, entity_map)
+        parsed_slot = create_slot(slot, schema_slot_counter, slots_prefix, schema["@id"],
+                                  slot_shared, entity_map)
         parsed_slot["roleName"] = parsed_slot["role"]
         del parsed_slot["role"]
 
@@ -262,108 +393,72 @@ def convert_yaml_to_sdf(yaml_data: Schema) -> Mapping[str, Any]:
     schema["slots"] = slots
 
     # Cleaning "-a" suffix for slots with counter == 1.
-    for cur_step in steps:
-        for cur_slot in cur_step["participants"]:
-            if schema_slot_counter[cur_slot["name"]] == 1:
-                temp = entity_map[cur_slot["@id"]]
-                del entity_map[cur_slot["@id"]]
-
-                cur_slot["@id"] = cur_slot["@id"].strip("-a")
-
-                entity_map[cur_slot["@id"]] = temp
+    singleton_names = {name for name, count in schema_slot_counter.items() if count == 1}
+    if singleton_names:
+        for cur_slot in all_step_slots:
+            if cur_slot["name"] in singleton_names:
+                # str.strip would also eat legitimate trailing "a"/"-" characters,
+                # so remove exactly the "-a" suffix
+                slot_id = cur_slot["@id"]
+                new_id = slot_id.removesuffix("-a")
+                if new_id != slot_id:
+                    cur_slot["@id"] = new_id
+                    entity_map[new_id] = entity_map.pop(slot_id)
 
     schema["steps"] = steps
 
-    step_ids = set(step.id for step in yaml_data.steps)
-    order_tuples: List[Tuple[str, ...]] = []
-    for order in yaml_data.order:
-        if isinstance(order, Before):
-            order_tuples.append((order.before, order.after))
-        elif isinstance(order, Container):
-            order_tuples.append((order.container, order.contained))
-        elif isinstance(order, Overlaps):
-            order_tuples.append(tuple(order.overlaps))
-        else:
-            raise NotImplementedError
-    order_ids = set(itertools.chain.from_iterable(order_tuples))
-    missing_order_ids = order_ids - step_ids
-    if missing_order_ids:
-        for missing_id in missing_order_ids:
-            logging.error(f"The ID '{missing_id}' in `order` is not in `steps`")
-        exit(1)
-
+    # Build the order relations, validating step IDs against step_map inline
     base_order_id = f'{schema["@id"]}/Order/'
     orders = []
+    missing_order_ids: Set[str] = set()
     for order in yaml_data.order:
         if isinstance(order, Before):
-            before_idx = step_map[order.before]['step_idx']
-            before_id = step_map[order.before]['id']
-            after_idx = step_map[order.after]['step_idx']
-            after_id = step_map[order.after]['id']
-            if not before_id and not before_idx:
-                logging.warning(f"before: {order.before} does not appear in the steps")
-            if not after_id and not after_idx:
-                logging.warning(f"after: {order.after} does not appear in the steps")
+            before = step_map.get(order.before)
+            after = step_map.get(order.after)
+            if before is None or after is None:
+                missing_order_ids.update(step_id for step_id in (order.before, order.after)
+                                         if step_id not in step_map)
+                continue
             cur_order: Mapping[str, Union[str, Sequence[str]]] = {
-                "@id": f"{base_order_id}precede-{before_idx}-{after_idx}",
-                "comment": f"{before_idx} precedes {after_idx}",
-                "before": before_id,
-                "after": after_id
+                "@id": f"{base_order_id}precede-{before.step_idx}-{after.step_idx}",
+                "comment": f"{before.step_idx} precedes {after.step_idx}",
+                "before": before.id,
+                "after": after.id
             }
         elif isinstance(order, Container):
-            container_idx = step_map[order.container]['step_idx']
-            container_id = step_map[order.container]['id']
-            contained_idx = step_map[order.contained]['step_idx']
-            contained_id = step_map[order.contained]['id']
-            if not container_id and not container_idx:
-                logging.warning(f"container: {order.container} does not appear in the steps")
-            if not contained_id and not contained_idx:
-                logging.warning(f"contained: {order.contained} does not appear in the steps")
+            container = step_map.get(order.container)
+            contained = step_map.get(order.contained)
+            if container is None or contained is None:
+                missing_order_ids.update(step_id for step_id in (order.container, order.contained)
+                                         if step_id not in step_map)
+                continue
             cur_order = {
-                "@id": f"{base_order_id}contain-{container_idx}-{contained_idx}",
-                "comment": f"{container_idx} contains {contained_idx}",
-                "container": container_id,
-                "contained": contained_id
+                "@id": f"{base_order_id}contain-{container.step_idx}-{contained.step_idx}",
+                "comment": f"{container.step_idx} contains {contained.step_idx}",
+                "container": container.id,
+                "contained": contained.id
             }
         elif isinstance(order, Overlaps):
-            overlaps_idx = []
-            overlaps_id = []
-            for overlap in order.overlaps:
-                overlap_idx = step_map[overlap]['step_idx']
-                overlap_id = step_map[overlap]['id']
-                if not overlap_id and not overlap_idx:
-                    logging.warning(f"overlaps: {overlap_id} does not appear in the steps")
-                overlaps_idx.append(overlap_idx)
-                overlaps_id.append(overlap_id)
+            if any(step_id not in step_map for step_id in order.overlaps):
+                missing_order_ids.update(step_id for step_id in order.overlaps
+                                         if step_id not in step_map)
+                continue
+            overlaps = [step_map[overlap] for overlap in order.overlaps]
+            overlaps_idx = [str(overlap.step_idx) for overlap in overlaps]
             cur_order = {
-                "@id": f"{base_order_id}overlap-{'-'.join(str(i) for i in overlaps_idx)}",
-                "comment": f"{', '.join(str(i) for i in overlaps_idx)} overlaps",
-                "overlaps": overlaps_id,
+                "@id": f"{base_order_id}overlap-{'-'.join(overlaps_idx)}",
+                "comment": f"{', '.join(overlaps_idx)} overlaps",
+                "overlaps": [overlap.id for overlap in overlaps],
             }
         else:
             raise NotImplementedError
         orders.append(cur_order)
+    if missing_order_ids:
+        for missing_id in missing_order_ids:
+            logger.error("The ID '%s' in `order` is not in `steps`", missing_id)
+        exit(1)
     schema["order"] = orders
 
-    # Get entity relations
-    entity_map = {x: y for x, y in entity_map.items() if y is not None}
-    # Get same as relation
-    reverse_entity_map = defaultdict(list)
-    for k, v in entity_map.items():
-        reverse_entity_map[v].append(k)
-    entity_relations: Sequence[Any] = []
-    # for v in reverse_entity_map.values():
-    #     cur_entity_relation = {
-    #         "relationSubject": v[0],
-    #         "relations": [{
-    #             "relationPredicate": "kairos:Relations/sameAs",
-    #             "relationObject": x
-    #         } for x in v[1:]]
-    #     }
-    #     if cur_entity_relation["relations"]:
-    #         entity_relations.append(cur_entity_relation)
-    schema["entityRelations"] = entity_relations
-
     return schema
 
 
@@ -378,8 +473,8 @@ def merge_schemas(schema_list: Sequence[Mapping[str, Any]], library_id: str) ->
         Data in JSON output format.
     """
     sdf = {
-        "@context": ["https://kairos-sdf.s3.amazonaws.com/context/kairos-v0.9.jsonld"],
-        "sdfVersion": "0.9",
+        "@context": SDF_CONTEXT,
+        "sdfVersion": SDF_VERSION,
         "@id": library_id,
         "schemas": schema_list,
     }
@@ -405,7 +500,7 @@ def validate_schemas(json_data: Mapping[str, Any]) -> None:
                             },
                             timeout=10)
     except requests.exceptions.Timeout:
-        logging.warning("Program validator is unavailable, so schema might not validate")
+        logger.warning("Program validator is unavailable, so schema might not validate")
     else:
         response = req.json()
         validator_messages = response['errorsList'] + response['warningsList']
@@ -425,21 +520,58 @@ def convert_all_yaml_to_sdf(yaml_schemas: Sequence[Mapping[str, Any]], library_i
     Returns:
         Data in JSON output format.
     """
-    sdf_schemas = []
+    json_data = merge_schemas(convert_schemas(yaml_schemas), library_id)
 
-    parsed_yaml = parse_obj_as(List[Schema], yaml_schemas)
-    if [p.dict(exclude_none=True) for p in parsed_yaml] != yaml_schemas:
+    validate_schemas(json_data)
+
+    return json_data
+
+
+def convert_schemas(yaml_schemas: Sequence[Mapping[str, Any]]) -> List[Mapping[str, Any]]:
+    """Converts raw YAML schemas into SDF schemas.
+
+    Args:
+        yaml_schemas: YAML schemas.
+
+    Returns:
+        Converted SDF schemas.
+    """
+    parsed_yaml = SCHEMA_LIST_ADAPTER.validate_python(yaml_schemas)
+    # The round-trip comparison doubles the pydantic work, so it is skipped under
+    # `python -O`; any() stops serializing at the first mismatching schema
+    if __debug__ and any(parsed.model_dump(exclude_none=True) != raw_schema
+                         for parsed, raw_schema in zip(parsed_yaml, yaml_schemas)):
         raise RuntimeError(
             "The parsed and raw schemas do not match. The schema might have misordered fields, or there is a bug in this script.")
-    for yaml_schema in parsed_yaml:
-        out_json = convert_yaml_to_sdf(yaml_schema)
-        sdf_schemas.append(out_json)
+    return [convert_yaml_to_sdf(yaml_schema) for yaml_schema in parsed_yaml]
 
-    json_data = merge_schemas(sdf_schemas, library_id)
 
-    validate_schemas(json_data)
+def load_yaml_schemas(yaml_file: Path) -> Sequence[Mapping[str, Any]]:
+    """Loads raw schemas from a YAML file.
 
-    return json_data
+    Args:
+        yaml_file: YAML file path.
+
+    Returns:
+        Raw schemas from the file.
+    """
+    with yaml_file.open() as file:
+        schemas: Sequence[Mapping[str, Any]] = yaml.load(file, Loader=YamlLoader)
+    return schemas
+
+
+def convert_yaml_file(yaml_file: Path) -> List[Mapping[str, Any]]:
+    """Loads and converts a single YAML file into SDF schemas.
+
+    Runs in worker processes; the cached ontology is loaded once per worker.
+
+    Args:
+        yaml_file: YAML file path.
+
+    Returns:
+        Converted SDF schemas from the file.
+    """
+    return convert_schemas(load_yaml_schemas(yaml_file))
 
 
 def convert_files(yaml_files: Sequence[Path], json_file: Path) -> None:
@@ -449,16 +581,17 @@ def convert_files(yaml_files: Sequence[Path], json_file: Path) -> None:
         yaml_files: List of YAML file paths.
         json_file: JSON file path.
     """
-    input_schemas = []
-    for yaml_file in yaml_files:
-        with yaml_file.open() as file:
-            yaml_data = yaml.safe_load(file)
-        input_schemas.extend(yaml_data)
+    # Parsing and conversion are CPU-bound, so files are converted in separate
+    # processes; map() keeps the schemas in input-file order
+    with ProcessPoolExecutor() as executor:
+        converted = executor.map(convert_yaml_file, yaml_files)
+    sdf_schemas = list(itertools.chain.from_iterable(converted))
+
+    output_library = merge_schemas(sdf_schemas, json_file.stem)
 
-    output_library = convert_all_yaml_to_sdf(input_schemas, json_file.stem)
+    validate_schemas(output_library)
 
-    with json_file.open("w") as file:
-        json.dump(output_library, file, ensure_ascii=True, indent=4)
+    json_file.write_bytes(orjson.dumps(output_library, option=orjson.OPT_INDENT_2))
 
 
 def main() -> None:
@@ -2,16 +2,13 @@
 
 from typing import Optional, Sequence, Union
 
-from pydantic import BaseModel, Extra
+from pydantic import BaseModel, ConfigDict
 
 
 class InternalBase(BaseModel):
     """Base class for schema objects."""
 
-    class Config:
-        """Model configuration."""
-
-        extra = Extra.forbid
+    model_config = ConfigDict(extra="forbid")
 
 
 class Slot(InternalBase):
@@ -26,10 +23,10 @@ class Slot(InternalBase):
     """
 
     role: str
-    refvar: Optional[str]
-    constraints: Optional[Sequence[str]]
-    reference: Optional[str]
-    comment: Optional[str]
+    refvar: Optional[str] = None
+    constraints: Optional[Sequence[str]] = None
+    reference: Optional[str] = None
+    comment: Optional[str] = None
 
 
 class Step(InternalBase):
@@ -44,7 +41,7 @@ class Step(InternalBase):
 
     id: str
     primitive: str
-    comment: Optional[str]
+    comment: Optional[str] = None
     slots: Sequence[Slot]
 
 
@@ -55,7 +52,7 @@ class Order(InternalBase):
         comment: Additional comments.
     """
 
-    comment: Optional[str]
+    comment: Optional[str] = None
 
 
 class Before(Order):
@@ -113,4 +110,4 @@ class Schema(InternalBase):
     slots: Sequence[Slot]
     steps: Sequence[Step]
     order: Sequence[Union[Before, Container, Overlaps]]
-    comment: Optional[str]
+    comment: Optional[str] = None